@@ -87,6 +87,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         max_counts: 3e7
         read_write_timeout: 10
         counting_edge_rising: True
+        output_dtype: 'float64' # optional, 'float64' or 'float32' (halves the size of the returned data)
 
     """
 
@@ -123,6 +124,8 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
     # timeout for the Read or/and write process in s
     _RWTimeout = ConfigOption('read_write_timeout', default=10)
     _counting_edge_rising = ConfigOption('counting_edge_rising', default=True)
+    # data type of the arrays returned by get_counter and count_odmr
+    _output_dtype = ConfigOption('output_dtype', default='float64', converter=np.dtype)
 
     def on_activate(self):
         """ Starts up the NI Card at activation.
@@ -130,18 +133,38 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         # the tasks used on that hardware device:
         self._counter_daq_tasks = list()
         self._counter_analog_daq_task = None
+        self._counter_raw_data = None
+        self._counter_all_data = None
         self._clock_daq_task = None
         self._scanner_clock_daq_task = None
         self._scanner_ao_task = None
         self._scanner_counter_daq_tasks = list()
         self._line_length = None
         self._odmr_length = None
+        self._odmr_configuration = None
+        self._odmr_raw_data = None
+        self._odmr_raw_analog_data = None
+        self._odmr_signal_data = None
+        self._odmr_all_data = None
+        self._odmr_acquisition_tasks = tuple()
+        self._odmr_channel_count = 0
         self._gated_counter_daq_task = None
         self._scanner_analog_daq_task = None
         self._odmr_pulser_daq_task = None
         self._oversampling = 0
         self._lock_in_active = False
 
+        # persistent containers for the number of samples read by DAQmx and their references,
+        # so that the readout methods do not create new ctypes objects on every call
+        self._counter_read_samples = daq.int32()
+        self._counter_read_samples_ref = daq.byref(self._counter_read_samples)
+        self._counter_analog_read_samples = daq.int32()
+        self._counter_analog_read_samples_ref = daq.byref(self._counter_analog_read_samples)
+        self._odmr_read_samples = daq.int32()
+        self._odmr_read_samples_ref = daq.byref(self._odmr_read_samples)
+        self._odmr_analog_read_samples = daq.int32()
+        self._odmr_analog_read_samples_ref = daq.byref(self._odmr_analog_read_samples)
+
         self._photon_sources = self._photon_sources if self._photon_sources is not None else list()
         self._scanner_counter_channels = self._scanner_counter_channels if self._scanner_counter_channels is not None else list()
         self._scanner_ai_channels = self._scanner_ai_channels if self._scanner_ai_channels is not None else list()
@@ -149,6 +172,13 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         # handle all the parameters given by the config
         self._current_position = np.zeros(len(self._scanner_ao_channels))
 
+        # the clock output terminals and the ODMR trigger channel are handed to DAQmx in every
+        # scanner and ODMR setup, so build and encode them only once
+        self._clock_internal_output = self._internal_output_terminal(self._clock_channel)
+        self._scanner_clock_internal_output = self._internal_output_terminal(
+            self._scanner_clock_channel)
+        self._odmr_trigger_terminal = self._odmr_trigger_channel.encode('ascii')
+
         if len(self._scanner_ao_channels) < len(self._scanner_voltage_ranges):
             self.log.error(
                 'Specify at least as many scanner_voltage_ranges as scanner_ao_channels!')
@@ -161,6 +191,12 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             self.log.error(
                 'Specify at least one counter or analog input channel for the scanner!')
 
+        # the count rates are scaled in place by the clock frequency, which needs a float array
+        if self._output_dtype not in (np.float32, np.float64):
+            self.log.error('output_dtype has to be float32 or float64, not {0}. Using float64 '
+                           'instead.'.format(self._output_dtype))
+            self._output_dtype = np.dtype(np.float64)
+
         # Analog output is always needed and it does not interfere with the
         # rest, so start it always and leave it running
         if self._start_analog_output() < 0:
@@ -248,8 +284,11 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         if clock_channel is not None:
             if not scanner:
                 self._clock_channel = clock_channel
+                self._clock_internal_output = self._internal_output_terminal(clock_channel)
             else:
                 self._scanner_clock_channel = clock_channel
+                self._scanner_clock_internal_output = self._internal_output_terminal(
+                    clock_channel)
 
         # use the correct clock channel in this method
         if scanner:
@@ -318,6 +357,17 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             return -1
         return 0
 
+    def _internal_output_terminal(self, clock_channel):
+        """ Returns the internal output terminal of a clock channel, encoded for DAQmx.
+
+        @param str clock_channel: physical channel of the clock, e.g. '/Dev1/Ctr0'
+
+        @return bytes: name of the terminal, e.g. b'/Dev1/Ctr0InternalOutput'
+        """
+        if clock_channel is None:
+            return None
+        return '{0}InternalOutput'.format(clock_channel).encode('ascii')
+
     def set_up_counter(self,
                        counter_channels=None,
                        sources=None,
@@ -347,7 +397,10 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
 
         my_counter_channels = counter_channels if counter_channels else self._counter_channels
         my_photon_sources = sources if sources else self._photon_sources
-        my_clock_channel = clock_channel if clock_channel else self._clock_channel
+        if clock_channel:
+            my_clock_output = self._internal_output_terminal(clock_channel)
+        else:
+            my_clock_output = self._clock_internal_output
 
         if len(my_photon_sources) < len(my_counter_channels):
             self.log.error('You have given {0} sources but {1} counting channels.'
@@ -392,7 +445,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                         # use this counter channel
                         ch,
                         # assign a named Terminal
-                        my_clock_channel + 'InternalOutput')
+                        my_clock_output)
 
                 # Set a Counter Input Control Timebase Source.
                 # Specify the terminal of the timebase which is used for the counter:
@@ -441,32 +494,33 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                 # add task to counter task list
                 self._counter_daq_tasks.append(task)
 
-                # Counter analog input task
-                if len(self._counter_ai_channels) > 0:
-                    atask = daq.TaskHandle()
-
-                    daq.DAQmxCreateTask('CounterAnalogIn', daq.byref(atask))
-
-                    daq.DAQmxCreateAIVoltageChan(
-                        atask,
-                        ', '.join(self._counter_ai_channels),
-                        'Counter Analog In',
-                        daq.DAQmx_Val_RSE,
-                        self._counter_voltage_range[0],
-                        self._counter_voltage_range[1],
-                        daq.DAQmx_Val_Volts,
-                        ''
-                    )
-                    # Analog in channel timebase
-                    daq.DAQmxCfgSampClkTiming(
-                        atask,
-                        my_clock_channel + 'InternalOutput',
-                        self._clock_frequency,
-                        daq.DAQmx_Val_Rising,
-                        daq.DAQmx_Val_ContSamps,
-                        int(self._clock_frequency * 5)
-                    )
-                    self._counter_analog_daq_task = atask
+            # Counter analog input task. All analog channels share a single task which is
+            # created once, independent of the number of counter channels.
+            if len(self._counter_ai_channels) > 0:
+                atask = daq.TaskHandle()
+
+                daq.DAQmxCreateTask('CounterAnalogIn', daq.byref(atask))
+
+                daq.DAQmxCreateAIVoltageChan(
+                    atask,
+                    ', '.join(self._counter_ai_channels),
+                    'Counter Analog In',
+                    daq.DAQmx_Val_RSE,
+                    self._counter_voltage_range[0],
+                    self._counter_voltage_range[1],
+                    daq.DAQmx_Val_Volts,
+                    ''
+                )
+                # Analog in channel timebase
+                daq.DAQmxCfgSampClkTiming(
+                    atask,
+                    my_clock_output,
+                    self._clock_frequency,
+                    daq.DAQmx_Val_Rising,
+                    daq.DAQmx_Val_ContSamps,
+                    int(self._clock_frequency * 5)
+                )
+                self._counter_analog_daq_task = atask
         except:
             self.log.exception('Error while setting up counting task.')
             return -1
@@ -505,7 +559,8 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                             readout frequency was defined in the counter setup.
                             That sets also the length of the readout array.
 
-        @return float [samples]: array with entries as photon counts per second
+        @return float [samples]: array with entries as photon counts per second. The array is
+                                 reused and overwritten by the next call.
         """
         if len(self._counter_daq_tasks) < 1:
             self.log.error(
@@ -524,15 +579,20 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         else:
             samples = int(samples)
         try:
-            # count data will be written here in the NumPy array of length samples
-            count_data = np.empty((len(self._counter_daq_tasks), 2 * samples), dtype=np.uint32)
+            # count data will be written here in the NumPy array of length samples. The buffer
+            # is kept between calls and only reallocated if the number of samples changes.
+            raw_shape = (len(self._counter_daq_tasks), 2 * samples)
+            if self._counter_raw_data is None or self._counter_raw_data.shape != raw_shape:
+                self._counter_raw_data = np.empty(raw_shape, dtype=np.uint32)
+            count_data = self._counter_raw_data
 
             # number of samples which were actually read, will be stored here
-            n_read_samples = daq.int32()
+            n_read_samples_ref = self._counter_read_samples_ref
+            read_counter = daq.DAQmxReadCounterU32
             for i, task in enumerate(self._counter_daq_tasks):
                 # read the counter value: This function is blocking and waits for the
                 # counts to be all filled:
-                daq.DAQmxReadCounterU32(
+                read_counter(
                     # read from this task
                     task,
                     # number of samples to read
@@ -544,16 +604,26 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     # length of array to write into
                     2 * samples,
                     # number of samples which were read
-                    daq.byref(n_read_samples),
+                    n_read_samples_ref,
                     # Reserved for future use. Pass NULL (here None) to this parameter
                     None)
 
+            # the output array is kept between calls and only reallocated if its shape changes
+            data_shape = (count_data.shape[0] + len(self._counter_ai_channels), samples)
+            if self._counter_all_data is None or self._counter_all_data.shape != data_shape:
+                self._counter_all_data = np.empty(data_shape, dtype=self._output_dtype)
+            all_data = self._counter_all_data
+
             # Analog channels
             if len(self._counter_ai_channels) > 0:
-                analog_data = np.full(
-                    (len(self._counter_ai_channels), samples), 111, dtype=np.float64)
-
-                analog_read_samples = daq.int32()
+                # the analog rows of the output are contiguous, so DAQmx can write into them
+                # directly as long as they hold float64 values
+                read_in_place = all_data.dtype == np.float64
+                if read_in_place:
+                    analog_data = all_data[count_data.shape[0]:]
+                else:
+                    analog_data = np.empty(
+                        (len(self._counter_ai_channels), samples), dtype=np.float64)
 
                 daq.DAQmxReadAnalogF64(
                     self._counter_analog_daq_task,
@@ -562,28 +632,22 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     daq.DAQmx_Val_GroupByChannel,
                     analog_data,
                     len(self._counter_ai_channels) * samples,
-                    daq.byref(analog_read_samples),
+                    self._counter_analog_read_samples_ref,
                     None
                 )
+                if not read_in_place:
+                    all_data[count_data.shape[0]:] = analog_data
         except:
             self.log.exception(
                 'Getting samples from counter failed.')
             # in case of error return a lot of -1
             return np.ones((len(self.get_counter_channels()), samples), dtype=np.uint32) * -1
 
-        real_data = np.empty((len(self._counter_channels), samples), dtype=np.uint32)
-
         # add up adjoint pixels to also get the counts from the low time of
-        # the clock:
-        real_data = count_data[:, ::2]
-        real_data += count_data[:, 1::2]
-
-        all_data = np.full((len(self.get_counter_channels()), samples), 222, dtype=np.float64)
-        # normalize to counts per second for counter channels
-        all_data[0:len(real_data)] = np.array(real_data * self._clock_frequency, np.float64)
-
-        if len(self._counter_ai_channels) > 0:
-            all_data[-len(self._counter_ai_channels):] = analog_data
+        # the clock and normalize to counts per second for counter channels:
+        real_data = all_data[:count_data.shape[0]]
+        np.add(count_data[:, ::2], count_data[:, 1::2], out=real_data)
+        real_data *= self._clock_frequency
 
         return all_data
 
@@ -647,6 +711,8 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         """
         if scanner:
             my_task = self._scanner_clock_daq_task
+            # a new scanner clock has to be configured again for ODMR
+            self._odmr_configuration = None
         else:
             my_task = self._clock_daq_task
         try:
@@ -911,7 +977,10 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
 
         my_counter_channels = counter_channels if counter_channels else self._scanner_counter_channels
         my_photon_sources = sources if sources else self._photon_sources
-        self._my_scanner_clock_channel = clock_channel if clock_channel else self._scanner_clock_channel
+        if clock_channel:
+            self._my_scanner_clock_output = self._internal_output_terminal(clock_channel)
+        else:
+            self._my_scanner_clock_output = self._scanner_clock_internal_output
 
         if scanner_ao_channels is not None:
             self._scanner_ao_channels = scanner_ao_channels
@@ -968,7 +1037,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     # use this counter channel
                     ch,
                     # assign a Terminal Name
-                    self._my_scanner_clock_channel + 'InternalOutput')
+                    self._my_scanner_clock_output)
 
                 # Set a CounterInput Control Timebase Source.
                 # Specify the terminal of the timebase which is used for the counter:
@@ -1166,7 +1235,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     # add to this task
                     self._scanner_ao_task,
                     # use this channel as clock
-                    self._my_scanner_clock_channel + 'InternalOutput',
+                    self._my_scanner_clock_output,
                     # Maximum expected clock frequency
                     self._scanner_clock_frequency,
                     # Generate sample on falling edge
@@ -1229,7 +1298,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                 # Analog in channel timebase
                 daq.DAQmxCfgSampClkTiming(
                     self._scanner_analog_daq_task,
-                    self._scanner_clock_channel + 'InternalOutput',
+                    self._scanner_clock_internal_output,
                     self._scanner_clock_frequency,
                     daq.DAQmx_Val_Rising,
                     daq.DAQmx_Val_ContSamps,
@@ -1289,7 +1358,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
 
             if pixel_clock and self._pixel_clock_channel is not None:
                 daq.DAQmxConnectTerms(
-                    self._scanner_clock_channel + 'InternalOutput',
+                    self._scanner_clock_internal_output,
                     self._pixel_clock_channel,
                     daq.DAQmx_Val_DoNotInvertPolarity)
 
@@ -1375,24 +1444,22 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
 
             if pixel_clock and self._pixel_clock_channel is not None:
                 daq.DAQmxDisconnectTerms(
-                    self._scanner_clock_channel + 'InternalOutput',
+                    self._scanner_clock_internal_output,
                     self._pixel_clock_channel)
 
             # create a new array for the final data (this time of the length
             # number of samples):
-            self._real_data = np.empty(
-                (len(self._scanner_counter_channels), self._line_length),
-                dtype=np.uint32)
+            all_data = np.empty(
+                (len(self.get_scanner_count_channels()), self._line_length), dtype=np.float64)
 
             # add up adjoint pixels to also get the counts from the low time of
-            # the clock:
-            self._real_data = self._scan_data[:, ::2]
-            self._real_data += self._scan_data[:, 1::2]
-
-            all_data = np.full(
-                (len(self.get_scanner_count_channels()), self._line_length), 2, dtype=np.float64)
-            all_data[0:len(self._real_data)] = np.array(
-                self._real_data * self._scanner_clock_frequency, np.float64)
+            # the clock and normalize to counts per second, both in place:
+            n_counters = len(self._scanner_counter_channels)
+            real_data = all_data[:n_counters]
+            np.add(self._scan_data[:n_counters, ::2],
+                   self._scan_data[:n_counters, 1::2],
+                   out=real_data)
+            real_data *= self._scanner_clock_frequency
 
             if self._scanner_ai_channels:
                 all_data[len(self._scanner_counter_channels):] = self._analog_data[:, :-1]
@@ -1480,7 +1547,13 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             self.log.error('Another analog is already running, close this one first.')
             return -1
 
-        my_clock_channel = clock_channel if clock_channel else self._scanner_clock_channel
+        # new tasks need to be configured by set_odmr_length in any case
+        self._odmr_configuration = None
+
+        if clock_channel:
+            my_clock_output = self._internal_output_terminal(clock_channel)
+        else:
+            my_clock_output = self._scanner_clock_internal_output
 
         if self._scanner_counter_channels and self._photon_sources:
             my_counter_channel = counter_channel if counter_channel else self._scanner_counter_channels[0]
@@ -1517,7 +1590,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                 daq.DAQmxSetCISemiPeriodTerm(
                     task,
                     my_counter_channel,
-                    my_clock_channel + 'InternalOutput')
+                    my_clock_output)
 
                 # define the source of ticks for the counter as self._photon_source
                 daq.DAQmxSetCICtrTimebaseSrc(
@@ -1525,6 +1598,23 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     my_counter_channel,
                     my_photon_source)
 
+                # The read properties do not depend on the sweep length, so they are set
+                # only once here instead of in set_odmr_length.
+                # read samples from beginning of acquisition, do not overwrite
+                daq.DAQmxSetReadRelativeTo(
+                    task,
+                    daq.DAQmx_Val_CurrReadPos)
+
+                # do not read first sample
+                daq.DAQmxSetReadOffset(
+                    task,
+                    0)
+
+                # unread data in buffer will be overwritten
+                daq.DAQmxSetReadOverWrite(
+                    task,
+                    daq.DAQmx_Val_DoNotOverwriteUnreadSamps)
+
                 self._scanner_counter_daq_tasks.append(task)
             except:
                 self.log.exception('Error while setting up the digital counter of ODMR scan.')
@@ -1567,12 +1657,18 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             # connect the clock to the trigger channel to give triggers for the
             # microwave
             daq.DAQmxConnectTerms(
-                self._scanner_clock_channel + 'InternalOutput',
-                self._odmr_trigger_channel,
+                self._scanner_clock_internal_output,
+                self._odmr_trigger_terminal,
                 daq.DAQmx_Val_DoNotInvertPolarity)
         except:
             self.log.exception('Error while setting up ODMR scan.')
             return -1
+
+        # the acquisition tasks started for every sweep, collected once for count_odmr
+        self._odmr_acquisition_tasks = tuple(self._scanner_counter_daq_tasks[:1])
+        if self._scanner_ai_channels:
+            self._odmr_acquisition_tasks += (self._scanner_analog_daq_task, )
+        self._odmr_channel_count = len(self.get_odmr_channels())
         return 0
 
     def set_odmr_length(self, length=100):
@@ -1590,7 +1686,23 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             self.log.error('No analog task is running, cannot do ODMR without one.')
             return -1
 
+        # reconfiguring the tasks costs several driver calls, skip it if neither the length nor
+        # the clock frequency changed since the last sweep
+        configuration = (length, self._scanner_clock_frequency)
+        if configuration == self._odmr_configuration:
+            return 0
+
         self._odmr_length = length
+        # raw read buffers for count_odmr, they are reused for all sweeps of this length
+        self._odmr_raw_data = np.empty((2 * length + 1, ), dtype=np.uint32)
+        self._odmr_raw_analog_data = np.empty(
+            (len(self._scanner_ai_channels), length + 1), dtype=np.float64)
+        # signal of all channels combined, only needed for the lock-in contrast
+        if self._odmr_pulser_daq_task:
+            self._odmr_signal_data = np.empty(
+                (len(self.get_odmr_channels()), length), dtype=np.float64)
+        else:
+            self._odmr_signal_data = None
         try:
             # set timing for odmr clock task to the number of pixel.
             daq.DAQmxCfgImplicitTiming(
@@ -1614,27 +1726,12 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     # This first pulse will start the count task.
                     2 * (self._odmr_length + 1))
 
-                # read samples from beginning of acquisition, do not overwrite
-                daq.DAQmxSetReadRelativeTo(
-                    self._scanner_counter_daq_tasks[0],
-                    daq.DAQmx_Val_CurrReadPos)
-
-                # do not read first sample
-                daq.DAQmxSetReadOffset(
-                    self._scanner_counter_daq_tasks[0],
-                    0)
-
-                # unread data in buffer will be overwritten
-                daq.DAQmxSetReadOverWrite(
-                    self._scanner_counter_daq_tasks[0],
-                    daq.DAQmx_Val_DoNotOverwriteUnreadSamps)
-
             # Analog
             if self._scanner_ai_channels:
                 # Analog in channel timebase
                 daq.DAQmxCfgSampClkTiming(
                     self._scanner_analog_daq_task,
-                    self._scanner_clock_channel + 'InternalOutput',
+                    self._scanner_clock_internal_output,
                     self._scanner_clock_frequency,
                     daq.DAQmx_Val_Rising,
                     daq.DAQmx_Val_ContSamps,
@@ -1645,7 +1742,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                 # pulser channel timebase
                 daq.DAQmxCfgSampClkTiming(
                     self._odmr_pulser_daq_task,
-                    self._scanner_clock_channel + 'InternalOutput',
+                    self._scanner_clock_internal_output,
                     self._scanner_clock_frequency,
                     daq.DAQmx_Val_Rising,
                     daq.DAQmx_Val_ContSamps,
@@ -1653,7 +1750,9 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                 )
         except:
             self.log.exception('Error while setting up ODMR counter.')
+            self._odmr_configuration = None
             return -1
+        self._odmr_configuration = configuration
         return 0
 
     @property
@@ -1689,7 +1788,8 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
 
         @param int length: length of microwave sweep in pixel
 
-        @return float[]: the photon counts per second
+        @return float[]: the photon counts per second. The array is reused and overwritten by
+                         the next sweep.
         """
         if len(self._scanner_counter_daq_tasks) < 1 and self._scanner_counter_channels:
             self.log.error(
@@ -1711,11 +1811,9 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             return True, np.array([-1.])
 
         try:
-            # start the scanner counting task that acquires counts synchronously
-            if self._scanner_counter_channels:
-                daq.DAQmxStartTask(self._scanner_counter_daq_tasks[0])
-            if self._scanner_ai_channels:
-                daq.DAQmxStartTask(self._scanner_analog_daq_task)
+            # start the scanner counting and analog tasks that acquire synchronously
+            for task in self._odmr_acquisition_tasks:
+                daq.DAQmxStartTask(task)
         except:
             self.log.exception('Cannot start ODMR counter.')
             return True, np.array([-1.])
@@ -1757,13 +1855,7 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
             # Digital
             if self._scanner_counter_channels:
                 # count data will be written here
-                odmr_data = np.full(
-                    (2 * self._odmr_length + 1, ),
-                    222,
-                    dtype=np.uint32)
-
-                #number of samples which were read will be stored here
-                n_read_samples = daq.int32()
+                odmr_data = self._odmr_raw_data
 
                 # actually read the counted photons
                 daq.DAQmxReadCounterU32(
@@ -1778,18 +1870,17 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     # length of array to write into
                     2 * self._odmr_length + 1,
                     # number of samples which were actually read
-                    daq.byref(n_read_samples),
+                    self._odmr_read_samples_ref,
                     # Reserved for future use. Pass NULL (here None) to this parameter.
                     None)
+                n_read_samples = self._odmr_read_samples.value
+                if n_read_samples != 2 * self._odmr_length + 1:
+                    self.log.warning('Only {0} of {1} counter samples were read for the ODMR '
+                                     'line.'.format(n_read_samples, 2 * self._odmr_length + 1))
 
             # Analog
             if self._scanner_ai_channels:
-                odmr_analog_data = np.full(
-                    (len(self._scanner_ai_channels), self._odmr_length + 1),
-                    222,
-                    dtype=np.float64)
-
-                analog_read_samples = daq.int32()
+                odmr_analog_data = self._odmr_raw_analog_data
 
                 daq.DAQmxReadAnalogF64(
                     self._scanner_analog_daq_task,
@@ -1798,70 +1889,64 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
                     daq.DAQmx_Val_GroupByChannel,
                     odmr_analog_data,
                     len(self._scanner_ai_channels) * (self._odmr_length + 1),
-                    daq.byref(analog_read_samples),
+                    self._odmr_analog_read_samples_ref,
                     None
                 )
+                n_read_samples = self._odmr_analog_read_samples.value
+                if n_read_samples != self._odmr_length + 1:
+                    self.log.warning('Only {0} of {1} analog samples were read for the ODMR '
+                                     'line.'.format(n_read_samples, self._odmr_length + 1))
 
             # stop the counter task
             daq.DAQmxStopTask(self._scanner_clock_daq_task)
-            if self._scanner_counter_channels:
-                daq.DAQmxStopTask(self._scanner_counter_daq_tasks[0])
-            if self._scanner_ai_channels:
-                daq.DAQmxStopTask(self._scanner_analog_daq_task)
+            for task in self._odmr_acquisition_tasks:
+                daq.DAQmxStopTask(task)
             if self._odmr_pulser_daq_task:
                 daq.DAQmxStopTask(self._odmr_pulser_daq_task)
 
-            # prepare array to return data
-            all_data = np.full((len(self.get_odmr_channels()), length),
-                               222,
-                               dtype=np.float64)
-            start_index = 0
-            if self._scanner_counter_channels:
-                # create a new array for the final data (this time of the length
-                # number of samples)
-                real_data = np.zeros((self._odmr_length, ), dtype=np.uint32)
-
-                # add upp adjoint pixels to also get the counts from the low time of
-                # the clock:
-
-                real_data += odmr_data[1:-1:2]
-                real_data += odmr_data[:-1:2]
-
-                if self._odmr_pulser_daq_task:
-                    differential_data = np.zeros((self.oversampling * length, ), dtype=np.float64)
-
-                    differential_data += real_data[1::2]
-                    differential_data -= real_data[::2]
-                    differential_data = np.divide(differential_data, real_data[::2],
-                                                  np.zeros_like(differential_data),
-                                                  where=real_data[::2] != 0)
-
-                    all_data[0] = np.median(np.reshape(differential_data,
-                                                       (-1, self.oversampling)),
-                                            axis=1
-                                            )
-                else:
-                    all_data[0] = np.array(real_data * self._scanner_clock_frequency, np.float64)
-                start_index += 1
-
-            if self._scanner_ai_channels:
-                if self._odmr_pulser_daq_task:
-                    for i, analog_data in enumerate(odmr_analog_data):
-                        differential_data = np.zeros((self.oversampling * length, ), dtype=np.float64)
-
-                        differential_data += analog_data[1:-1:2]
-                        differential_data -= analog_data[:-1:2]
-                        differential_data = np.divide(differential_data, analog_data[:-1:2],
-                                                      np.zeros_like(differential_data),
-                                                      where=analog_data[:-1:2] != 0)
-
-                        all_data[i+start_index] = np.median(np.reshape(differential_data,
-                                                                       (-1, self.oversampling)),
-                                                            axis=1
-                                                            )
+            # prepare array to return data, every row of it is written below. The array is
+            # kept between sweeps and only reallocated if its shape changes.
+            data_shape = (self._odmr_channel_count, length)
+            if self._odmr_all_data is None or self._odmr_all_data.shape != data_shape:
+                self._odmr_all_data = np.empty(data_shape, dtype=self._output_dtype)
+            all_data = self._odmr_all_data
+            n_counters = 1 if self._scanner_counter_channels else 0
+            if self._odmr_pulser_daq_task:
+                # Collect the signal of all channels in one array, so that the lock-in contrast
+                # is computed for all of them at once. The counts of the low time of the clock
+                # are added to the adjoint pixels.
+                signal_data = self._odmr_signal_data
+                if n_counters:
+                    np.add(odmr_data[1:-1:2], odmr_data[:-1:2], out=signal_data[0])
+                if self._scanner_ai_channels:
+                    signal_data[n_counters:] = odmr_analog_data[:, :-1]
+
+                # The contrast is computed in place in the odd columns of the signal array,
+                # which are not needed afterwards. Pixels without reference signal are set to 0.
+                # The median is taken over the oversampling axis of a
+                # (channels, length, oversampling) view.
+                reference_data = signal_data[:, ::2]
+                differential_data = signal_data[:, 1::2]
+                valid_reference = reference_data != 0
+                np.subtract(differential_data, reference_data, out=differential_data)
+                np.divide(differential_data,
+                          reference_data,
+                          out=differential_data,
+                          where=valid_reference)
+                differential_data[~valid_reference] = 0
+
+                all_data[:] = np.median(
+                    differential_data.reshape((-1, length, self.oversampling)),
+                    axis=2)
+            else:
+                if n_counters:
+                    # add upp adjoint pixels to also get the counts from the low time of
+                    # the clock and normalize to counts per second, both in place:
+                    np.add(odmr_data[1:-1:2], odmr_data[:-1:2], out=all_data[0])
+                    all_data[0] *= self._scanner_clock_frequency
 
-                else:
-                    all_data[start_index:] = odmr_analog_data[:, :-1]
+                if self._scanner_ai_channels:
+                    all_data[n_counters:] = odmr_analog_data[:, :-1]
 
             return False, all_data
         except:
@@ -1874,11 +1959,13 @@ class NationalInstrumentsXSeries(Base, SlowCounterInterface, ConfocalScannerInte
         @return int: error code (0:OK, -1:error)
         """
         retval = 0
+        self._odmr_configuration = None
+        self._odmr_acquisition_tasks = tuple()
         try:
             # disconnect the trigger channel
             daq.DAQmxDisconnectTerms(
-                self._scanner_clock_channel + 'InternalOutput',
-                self._odmr_trigger_channel)
+                self._scanner_clock_internal_output,
+                self._odmr_trigger_terminal)
 
         except:
             self.log.exception('Error while disconnecting ODMR clock channel.')
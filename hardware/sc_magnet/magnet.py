@@ -73,6 +73,19 @@ class Magnet(Base, MagnetInterface):
     z_constr = ConfigOption('magnet_z_constr', 3.0)
     rho_constr = ConfigOption('magnet_rho_constr', 1.2)
 
+    # translation table removing the line endings the magnet appends to its answers
+    _line_ending_table = str.maketrans('', '', '\r\n')
+
+    # labels of the spherical axes reported by get_status
+    _axis_labels = ('rho', 'theta', 'phi')
+
+    # constant commands, encoded once instead of on every call
+    _cmd_heat_switch = b'PS 1\n'
+    _cmd_cool_switch = b'PS 0\n'
+    _cmd_ramp = b'RAMP\n'
+    _cmd_zero = b'ZERO\n'
+    _cmd_pause = b'PAUSE\n'
+
     def __init__(self, **kwargs):
         """Here the connections to the power supplies and to the counter are established"""
         super().__init__(**kwargs)
@@ -112,6 +125,8 @@ class Magnet(Base, MagnetInterface):
         self.soc_x.connect((self.ip_addr_x, self.port))
         self.soc_y.connect((self.ip_addr_y, self.port))
         self.soc_z.connect((self.ip_addr_z, self.port))
+        # sockets of the coils by axis label, to address a single coil without branching
+        self._sockets = {'x': self.soc_x, 'y': self.soc_y, 'z': self.soc_z}
 
 #       sending a signal to all coils to receive an answer to cut off the
 #       useless welcome message.
@@ -249,8 +264,7 @@ class Magnet(Base, MagnetInterface):
             # an answer.
             answer_dict['x'] = self.byte_to_utf8(self.soc_x.recv(1024))  # receive an answer
 
-            answer_dict['x'] = answer_dict['x'].replace('\r', '')
-            answer_dict['x'] = answer_dict['x'].replace('\n', '')
+            answer_dict['x'] = answer_dict['x'].translate(self._line_ending_table)
         if param_dict.get('y') is not None:
             if not param_dict['y'].endswith('\n'):
                 param_dict['y'] += '\n'
@@ -262,8 +276,7 @@ class Magnet(Base, MagnetInterface):
             # time.sleep(self.waitingtime)                   # you need to wait until magnet generating
             # an answer.
             answer_dict['y'] = self.byte_to_utf8(self.soc_y.recv(1024))  # receive an answer
-            answer_dict['y'] = answer_dict['y'].replace('\r', '')
-            answer_dict['y'] = answer_dict['y'].replace('\n', '')
+            answer_dict['y'] = answer_dict['y'].translate(self._line_ending_table)
         if param_dict.get('z') is not None:
             if not param_dict['z'].endswith('\n'):
                 param_dict['z'] += '\n'
@@ -275,8 +288,7 @@ class Magnet(Base, MagnetInterface):
             # time.sleep(self.waitingtime)                   # you need to wait until magnet generating
             # an answer.
             answer_dict['z'] = self.byte_to_utf8(self.soc_z.recv(1024))  # receive an answer
-            answer_dict['z'] = answer_dict['z'].replace('\r', '')
-            answer_dict['z'] = answer_dict['z'].replace('\n', '')
+            answer_dict['z'] = answer_dict['z'].translate(self._line_ending_table)
 
         if len(answer_dict) == 0:
             self.log.warning('no parameter_dict was given therefore the '
@@ -328,8 +340,7 @@ class Magnet(Base, MagnetInterface):
                 translated_status = 1
             status_dict[axes] = translated_status
         # adjusting to the axis problem
-        axes = ['rho', 'theta', 'phi']
-        return_dict = {axes[i] : status_dict[old_key] for i, old_key in enumerate(status_dict)}
+        return_dict = {self._axis_labels[i]: status_dict[old_key] for i, old_key in enumerate(status_dict)}
 
         return return_dict
 
@@ -338,14 +349,11 @@ class Magnet(Base, MagnetInterface):
             step to conduct current to the coils.
             @param string axis: desired axis (x, y, z)
             """
-        if axis == "x":
-            self.soc_x.send(self.utf8_to_byte("PS 1\n"))
-        elif axis == "y":
-            self.soc_y.send(self.utf8_to_byte("PS 1\n"))
-        elif axis == "z":
-            self.soc_z.send(self.utf8_to_byte("PS 1\n"))
-        else:
+        soc = self._sockets.get(axis)
+        if soc is None:
             self.log.error("In function heat_switch only 'x', 'y' and 'z' are possible axes")
+            return
+        soc.send(self._cmd_heat_switch)
 
     def heat_all_switches(self):
         """ Just a convenience function to heat all switches at once,  as it is unusual
@@ -358,14 +366,11 @@ class Magnet(Base, MagnetInterface):
         """ Turns off the heating of the PJSwitch,  axis depending on user input
             @param string axis: desired axis (x, y, z)
             """
-        if axis == "x":
-            self.soc_x.send(self.utf8_to_byte("PS 0\n"))
-        elif axis == "y":
-            self.soc_y.send(self.utf8_to_byte("PS 0\n"))
-        elif axis == "z":
-            self.soc_z.send(self.utf8_to_byte("PS 0\n"))
-        else:
+        soc = self._sockets.get(axis)
+        if soc is None:
             self.log.error("In function cool_switch only 'x', 'y' and 'z' are possible axes")
+            return
+        soc.send(self._cmd_cool_switch)
 
     def cool_all_switches(self):
         """ Just a convenience function to cool all switches at once This will take 600s."""
@@ -485,16 +490,16 @@ class Magnet(Base, MagnetInterface):
             @return int: error code (0:OK, -1:error)
             """
         if param_list is None:
-            self.soc_x.send(self.utf8_to_byte("RAMP\n"))
-            self.soc_y.send(self.utf8_to_byte("RAMP\n"))
-            self.soc_z.send(self.utf8_to_byte("RAMP\n"))
+            self.soc_x.send(self._cmd_ramp)
+            self.soc_y.send(self._cmd_ramp)
+            self.soc_z.send(self._cmd_ramp)
         else:
             if 'x' in param_list:
-                self.soc_x.send(self.utf8_to_byte("RAMP\n"))
+                self.soc_x.send(self._cmd_ramp)
             elif 'y' in param_list:
-                self.soc_y.send(self.utf8_to_byte("RAMP\n"))
+                self.soc_y.send(self._cmd_ramp)
             elif 'z' in param_list:
-                self.soc_z.send(self.utf8_to_byte("RAMP\n"))
+                self.soc_z.send(self._cmd_ramp)
             else:
                 self.log.warning('in function ramp your definition of '
                 'param_list was incorrect')
@@ -507,14 +512,11 @@ class Magnet(Base, MagnetInterface):
             @param axis: string axis: (allowed inputs 'x', 'y' and 'z')
             """
 
-        if axis == "x":
-            self.soc_x.send(self.utf8_to_byte("ZERO\n"))
-        elif axis == "y":
-            self.soc_y.send(self.utf8_to_byte("ZERO\n"))
-        elif axis == "z":
-            self.soc_z.send(self.utf8_to_byte("ZERO\n"))
-        else:
+        soc = self._sockets.get(axis)
+        if soc is None:
             self.log.error("In function ramp_to_zero only 'x', 'y' and 'z' are possible axes")
+            return
+        soc.send(self._cmd_zero)
 
     def calibrate(self, param_list=None):
         """ Calibrates the stage. In the case of the super conducting magnet
@@ -657,11 +659,11 @@ class Magnet(Base, MagnetInterface):
             # theta was in a correct interval before but isn't now ( change of interval )
             self.log.debug('need rotation around phi to adjust for negative theta value')
             self.log.debug('old int: {0}, new int: {1}'.format(self._inter, inter1))
-            if int(np.abs(self._inter - inter1)) is 1:
+            if abs(self._inter - inter1) == 1:
                 phi += np.pi
 
             # theta wasn't in a correct interval before and is still in the same interval ( in this case do nothing )
-            elif int(np.abs(self._inter - inter1)) is 0:
+            elif self._inter == inter1:
                 phi += np.pi
 
             else:
@@ -693,8 +695,8 @@ class Magnet(Base, MagnetInterface):
             self.log.warning("move_abs hasn't done anything, see check_constraints message why")
             return -1
 
-        if check_1 is check_2:
-            if check_1 is 0:
+        if check_1 == check_2:
+            if check_1 == 0:
                 return 0
         else:
             return -1
@@ -954,21 +956,21 @@ class Magnet(Base, MagnetInterface):
             @return integer: 0 everything is ok and -1 an error occured.
             """
         if not param_list:
-            self.soc_x.send(self.utf8_to_byte("PAUSE\n"))
-            self.soc_y.send(self.utf8_to_byte("PAUSE\n"))
-            self.soc_z.send(self.utf8_to_byte("PAUSE\n"))
+            self.soc_x.send(self._cmd_pause)
+            self.soc_y.send(self._cmd_pause)
+            self.soc_z.send(self._cmd_pause)
         elif len(param_list) > 0:
             self.log.warning('Some useless parameters were passed.')
             return -1
         else:
             if 'x' in param_list:
-                self.soc_x.send(self.utf8_to_byte("PAUSE\n"))
+                self.soc_x.send(self._cmd_pause)
                 param_list.remove('x')
             if 'y' in param_list:
-                self.soc_y.send(self.utf8_to_byte("PAUSE\n"))
+                self.soc_y.send(self._cmd_pause)
                 param_list.remove('y')
             if 'z' in param_list:
-                self.soc_z.send(self.utf8_to_byte("PAUSE\n"))
+                self.soc_z.send(self._cmd_pause)
                 param_list.remove('z')
 
         return 0
@@ -1197,13 +1199,13 @@ class Magnet(Base, MagnetInterface):
                 self.log.error("In check_constraints list has not the right amount of elements (3).")
                 return [-1, -1, -1]
             if mode == "normal_mode":
-                if np.abs(x_val) > self.x_constr:
+                if abs(x_val) > self.x_constr:
                     my_boolean = False
 
-                if np.abs(y_val) > self.y_constr:
+                if abs(y_val) > self.y_constr:
                     my_boolean = False
 
-                if np.abs(z_val) > self.x_constr:
+                if abs(z_val) > self.x_constr:
 
                     my_boolean = False
 
@@ -1219,7 +1221,7 @@ class Magnet(Base, MagnetInterface):
                 # 3T * cos(5°)
                 height_cone = 2.9886
 
-                if (np.abs(z_val) <= height_cone) and ((x_val**2 + y_val**2) <= z_val**2):
+                if (abs(z_val) <= height_cone) and ((x_val**2 + y_val**2) <= z_val**2):
                     my_boolean = True
                 elif x_val**2 + y_val**2 + (z_val - height_cone)**2 <= self.rho_constr:
                     my_boolean = True
@@ -97,7 +97,7 @@ class SwitchDummy(Base, SwitchInterface):
         @param str switch: name of the switch to query the state for
         @return str: The current switch state
         """
-        assert switch in self.available_states, f'Invalid switch name: "{switch}"'
+        assert switch in self._switches, f'Invalid switch name: "{switch}"'
         return self._states[switch]
 
     def set_state(self, switch, state):
@@ -106,7 +106,6 @@ class SwitchDummy(Base, SwitchInterface):
         @param str switch: name of the switch to change
         @param str state: name of the state to set
         """
-        avail_states = self.available_states
-        assert switch in avail_states, f'Invalid switch name: "{switch}"'
-        assert state in avail_states[switch], f'Invalid state name "{state}" for switch "{switch}"'
+        assert switch in self._switches, f'Invalid switch name: "{switch}"'
+        assert state in self._switches[switch], f'Invalid state name "{state}" for switch "{switch}"'
         self._states[switch] = state
@@ -221,6 +221,9 @@ class MagnetLogic(GenericLogic):
         # relative movement settings
 
         constraints = self._magnet_device.get_constraints()
+        # the axis labels do not change, so keep them instead of asking the
+        # hardware for its constraints in every position check
+        self._magnet_axes = list(constraints)
         self.move_rel_dict = {}
 
         for axis_label in constraints:
@@ -234,13 +237,11 @@ class MagnetLogic(GenericLogic):
         if 'align_2d_axis0_name' in self._statusVariables:
             self.align_2d_axis0_name = self._statusVariables['align_2d_axis0_name']
         else:
-            axes = list(self._magnet_device.get_constraints())
-            self.align_2d_axis0_name = axes[0]
+            self.align_2d_axis0_name = self._magnet_axes[0]
         if 'align_2d_axis1_name' in self._statusVariables:
             self.align_2d_axis1_name = self._statusVariables['align_2d_axis1_name']
         else:
-            axes = list(self._magnet_device.get_constraints())
-            self.align_2d_axis1_name = axes[1]
+            self.align_2d_axis1_name = self._magnet_axes[1]
 
         self.sigTest.connect(self._do_premeasurement_proc)
 
@@ -1002,8 +1003,7 @@ class MagnetLogic(GenericLogic):
 
         @return bool: True indicates the magnet is moving, False the magnet stopped movement
         """
-        # get axis names
-        axes = [i for i in self._magnet_device.get_constraints()]
+        axes = self._magnet_axes
         state = self._magnet_device.get_status()
 
         return (state[axes[0]] or state[axes[1]] or state[axes[2]]) is (1 or -1)